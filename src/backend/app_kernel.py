@@ -84,6 +84,19 @@ app.add_middleware(
 app.add_middleware(HealthCheckMiddleware, password="", checks={})
 logging.info("Added health check middleware")
 
+# Target date format per locale used by format_dates_in_messages
+LOCALE_DATE_FORMATS = {
+    "en-IN": "%d %b %Y",       # 30 Jul 2025
+    "en-US": "%b %d, %Y",      # Jul 30, 2025
+}
+
+# Match both "Jul 30, 2025, 12:00:00 AM" and "30 Jul 2025"
+DATE_PATTERN = re.compile(
+    r'(\d{1,2} [A-Za-z]{3,9} \d{4}|[A-Za-z]{3,9} \d{1,2}, \d{4}(, \d{1,2}:\d{2}:\d{2} ?[APap][Mm])?)'
+)
+
+RATE_LIMIT_PATTERN = re.compile(r"Rate limit is exceeded\. Try again in (\d+) seconds?\.")
+
 
 def format_dates_in_messages(messages, target_locale="en-US"):
     """
@@ -96,15 +109,7 @@ def format_dates_in_messages(messages, target_locale="en-US"):
     Returns:
         Formatted messages with dates converted to target locale format
     """
-    # Define target format patterns per locale
-    locale_date_formats = {
-        "en-IN": "%d %b %Y",       # 30 Jul 2025
-        "en-US": "%b %d, %Y",      # Jul 30, 2025
-    }
-
-    output_format = locale_date_formats.get(target_locale, "%d %b %Y")
-    # Match both "Jul 30, 2025, 12:00:00 AM" and "30 Jul 2025"
-    date_pattern = r'(\d{1,2} [A-Za-z]{3,9} \d{4}|[A-Za-z]{3,9} \d{1,2}, \d{4}(, \d{1,2}:\d{2}:\d{2} ?[APap][Mm])?)'
+    output_format = LOCALE_DATE_FORMATS.get(target_locale, "%d %b %Y")
 
     def convert_date(match):
         date_str = match.group(0)
@@ -122,13 +127,13 @@ def format_dates_in_messages(messages, target_locale="en-US"):
                 # Create a copy of the message with formatted content
                 formatted_message = message.model_copy() if hasattr(message, 'model_copy') else message
                 if hasattr(formatted_message, 'content'):
-                    formatted_message.content = re.sub(date_pattern, convert_date, formatted_message.content)
+                    formatted_message.content = DATE_PATTERN.sub(convert_date, formatted_message.content)
                 formatted_messages.append(formatted_message)
             else:
                 formatted_messages.append(message)
         return formatted_messages
     elif isinstance(messages, str):
-        return re.sub(date_pattern, convert_date, messages)
+        return DATE_PATTERN.sub(convert_date, messages)
     else:
         return messages
 
@@ -175,7 +180,7 @@ async def input_task_endpoint(input_task: InputTask, request: Request):
     """
     # Fix 1: Properly await the async rai_success function
     if not await rai_success(input_task.description, True):
-        print("RAI failed")
+        logging.warning("RAI failed")
 
         track_event_if_configured(
             "RAI failed",
@@ -267,7 +272,7 @@ async def input_task_endpoint(input_task: InputTask, request: Request):
         # Extract clean error message for rate limit errors
         error_msg = str(e)
         if "Rate limit is exceeded" in error_msg:
-            match = re.search(r"Rate limit is exceeded\. Try again in (\d+) seconds?\.", error_msg)
+            match = RATE_LIMIT_PATTERN.search(error_msg)
             if match:
                 error_msg = f"Rate limit is exceeded. Try again in {match.group(1)} seconds."
 
@@ -446,7 +451,7 @@ async def human_clarification_endpoint(
         description: Missing or invalid user information
     """
     if not await rai_success(human_clarification.human_clarification, False):
-        print("RAI failed")
+        logging.warning("RAI failed")
         track_event_if_configured(
             "RAI failed",
             {
@@ -724,10 +729,12 @@ async def get_plans(
             )
             raise HTTPException(status_code=404, detail="Plan not found")
 
-        # Use get_steps_by_plan to match the original implementation
-        steps = await memory_store.get_steps_by_plan(plan_id=plan.id)
-        messages = await memory_store.get_data_by_type_and_session_id(
-            "agent_message", session_id=plan.session_id
+        # Steps and messages are independent, so fetch them concurrently
+        steps, messages = await asyncio.gather(
+            memory_store.get_steps_by_plan(plan_id=plan.id),
+            memory_store.get_data_by_type_and_session_id(
+                "agent_message", session_id=plan.session_id
+            ),
         )
 
         plan_with_steps = PlanWithSteps(**plan.model_dump(), steps=steps)
@@ -739,9 +746,9 @@ async def get_plans(
         return [plan_with_steps, formatted_messages]
 
     all_plans = await memory_store.get_all_plans()
-    # Fetch steps for all plans concurrently
-    steps_for_all_plans = await asyncio.gather(
-        *[memory_store.get_steps_by_plan(plan_id=plan.id) for plan in all_plans]
+    # Fetch steps for all plans concurrently, bounded to avoid flooding Cosmos
+    steps_for_all_plans = await memory_store.get_steps_for_plans(
+        [plan.id for plan in all_plans]
     )
     # Create list of PlanWithSteps and update step counts
     list_of_plans_with_steps = []
@@ -985,10 +992,9 @@ async def delete_all_messages(request: Request) -> Dict[str, str]:
     # Initialize memory context
     kernel, memory_store = await initialize_runtime_and_context("", user_id)
 
-    await memory_store.delete_all_items("plan")
-    await memory_store.delete_all_items("session")
-    await memory_store.delete_all_items("step")
-    await memory_store.delete_all_items("agent_message")
+    await memory_store.delete_all_items_of_types(
+        ["plan", "session", "step", "agent_message"]
+    )
 
     # Clear the agent factory cache
     AgentFactory.clear_cache()
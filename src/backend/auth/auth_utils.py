@@ -2,6 +2,8 @@ import base64
 import json
 import logging
 
+from . import sample_user
+
 
 def get_authenticated_user_details(request_headers):
     user_object = {}
@@ -10,13 +12,12 @@ def get_authenticated_user_details(request_headers):
     if "x-ms-client-principal-id" not in request_headers:
         logging.info("No user principal found in headers")
         # if it's not, assume we're in development mode and return a default user
-        from . import sample_user
-
         raw_user_object = sample_user.sample_user
     else:
         # if it is, get the user details from the EasyAuth headers
-        raw_user_object = {k: v for k, v in request_headers.items()}
+        raw_user_object = request_headers
 
+    # Lowercase keys in a single pass over the headers
     normalized_headers = {k.lower(): v for k, v in raw_user_object.items()}
     user_object["user_principal_id"] = normalized_headers.get(
         "x-ms-client-principal-id"
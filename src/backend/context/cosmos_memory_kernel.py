@@ -10,6 +10,7 @@ import numpy as np
 
 from azure.cosmos.partition_key import PartitionKey
 from azure.cosmos.aio import CosmosClient
+from azure.cosmos.exceptions import CosmosBatchOperationError
 from helpers.azure_credential_utils import get_azure_credential
 from semantic_kernel.memory.memory_record import MemoryRecord
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
@@ -20,6 +21,22 @@ from app_config import config
 from models.messages_kernel import BaseDataModel, Plan, Session, Step, AgentMessage
 
 
+# Cosmos DB caps a transactional batch at 100 operations and 2 MB of payload;
+# the byte budget leaves headroom for the request envelope
+COSMOS_BATCH_LIMIT = 100
+COSMOS_BATCH_MAX_BYTES = 1_800_000
+
+# Cap on concurrent Cosmos queries when fanning out point reads and deletes
+COSMOS_MAX_CONCURRENCY = 8
+
+# Stored message roles mapped to kernel roles; anything else is treated as assistant
+ROLE_MAPPING = {
+    "user": AuthorRole.USER,
+    "system": AuthorRole.SYSTEM,
+    "tool": AuthorRole.TOOL,  # Equivalent to FunctionExecutionResultMessage
+}
+
+
 # Add custom JSON encoder class for datetime objects
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for handling datetime objects."""
@@ -41,6 +58,12 @@ class CosmosMemoryContext(MemoryStoreBase):
         # Messages are handled separately
     }
 
+    # Container proxies keyed by (endpoint, database, container), shared across
+    # contexts so each request does not repeat create_container_if_not_exists
+    _container_cache: Dict[Tuple[str, str, str], Any] = {}
+    # In-flight container setups, so concurrent first requests share one call
+    _container_inflight: Dict[Tuple[str, str, str], "asyncio.Future"] = {}
+
     def __init__(
         self,
         session_id: str,
@@ -64,26 +87,50 @@ class CosmosMemoryContext(MemoryStoreBase):
         self.session_id = session_id
         self.user_id = user_id
         self._initialized = asyncio.Event()
+        # Shared by every batch fan-out on this context so overlapping calls share the budget
+        self._query_semaphore = asyncio.Semaphore(COSMOS_MAX_CONCURRENCY)
         # Skip auto-initialize in constructor to avoid requiring a running event loop
         self._initialized.set()
 
+    @classmethod
+    def clear_container_cache(cls) -> None:
+        """Forget cached container proxies, e.g. after a container is recreated or between tests."""
+        cls._container_cache.clear()
+
     async def initialize(self):
         """Initialize the memory context using CosmosDB."""
-        try:
-            if not self._database:
-                # Create Cosmos client
-                cosmos_client = CosmosClient(
-                    self._cosmos_endpoint, credential=get_azure_credential()
-                )
-                self._database = cosmos_client.get_database_client(
-                    self._cosmos_database
-                )
+        cache_key = (
+            self._cosmos_endpoint,
+            self._cosmos_database,
+            self._cosmos_container,
+        )
+        cached_container = self._container_cache.get(cache_key)
+        if cached_container is not None:
+            self._container = cached_container
+            self._initialized.set()
+            return
 
-            # Set up CosmosDB container
-            self._container = await self._database.create_container_if_not_exists(
-                id=self._cosmos_container,
-                partition_key=PartitionKey(path="/session_id"),
-            )
+        try:
+            pending = self._container_inflight.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._create_container())
+                self._container_inflight[cache_key] = pending
+
+                def on_setup_done(future: "asyncio.Future") -> None:
+                    self._container_inflight.pop(cache_key, None)
+                    # Retrieve any failure so it is not reported as unretrieved
+                    # when every waiter was cancelled before it finished
+                    if not future.cancelled() and future.exception() is not None:
+                        logging.warning(
+                            "CosmosDB container setup for %s failed: %s",
+                            self._cosmos_container,
+                            future.exception(),
+                        )
+
+                pending.add_done_callback(on_setup_done)
+            # Shield so one cancelled caller does not cancel the shared setup
+            self._container = await asyncio.shield(pending)
+            self._container_cache[cache_key] = self._container
         except Exception as e:
             logging.error(
                 f"Failed to initialize CosmosDB container: {e}. Continuing without CosmosDB for testing."
@@ -93,6 +140,30 @@ class CosmosMemoryContext(MemoryStoreBase):
 
         self._initialized.set()
 
+    async def _create_container(self):
+        """Create the Cosmos client if needed and return the container proxy."""
+        if not self._database:
+            if (
+                self._cosmos_endpoint == config.COSMOSDB_ENDPOINT
+                and self._cosmos_database == config.COSMOSDB_DATABASE
+            ):
+                # Share the app-wide client and its connection pool
+                self._database = config.get_cosmos_database_client()
+            else:
+                # Create Cosmos client
+                cosmos_client = CosmosClient(
+                    self._cosmos_endpoint, credential=get_azure_credential()
+                )
+                self._database = cosmos_client.get_database_client(
+                    self._cosmos_database
+                )
+
+        # Set up CosmosDB container
+        return await self._database.create_container_if_not_exists(
+            id=self._cosmos_container,
+            partition_key=PartitionKey(path="/session_id"),
+        )
+
     # Helper method for awaiting initialization
     async def ensure_initialized(self):
         """Ensure that the container is initialized."""
@@ -114,22 +185,24 @@ class CosmosMemoryContext(MemoryStoreBase):
                     "CosmosDB container is not available. Initialization failed."
                 )
 
+    @staticmethod
+    def _serialize_item(item: BaseDataModel) -> Dict[str, Any]:
+        """Dump a data model to a dict with datetimes as ISO format strings."""
+        return {
+            key: value.isoformat() if isinstance(value, datetime.datetime) else value
+            for key, value in item.model_dump().items()
+        }
+
     async def add_item(self, item: BaseDataModel) -> None:
         """Add a data model item to Cosmos DB."""
         await self.ensure_initialized()
 
         try:
-            # Convert the model to a dict
-            document = item.model_dump()
-
-            # Handle datetime objects by converting them to ISO format strings
-            for key, value in list(document.items()):
-                if isinstance(value, datetime.datetime):
-                    document[key] = value.isoformat()
+            document = self._serialize_item(item)
 
             # Now create the item with the serialized datetime values
             await self._container.create_item(body=document)
-            logging.info(f"Item added to Cosmos DB - {document['id']}")
+            logging.debug("Item added to Cosmos DB - %s", document["id"])
         except Exception as e:
             logging.exception(f"Failed to add item to Cosmos DB: {e}")
             raise  # Propagate the error instead of silently failing
@@ -139,13 +212,7 @@ class CosmosMemoryContext(MemoryStoreBase):
         await self.ensure_initialized()
 
         try:
-            # Convert the model to a dict
-            document = item.model_dump()
-
-            # Handle datetime objects by converting them to ISO format strings
-            for key, value in list(document.items()):
-                if isinstance(value, datetime.datetime):
-                    document[key] = value.isoformat()
+            document = self._serialize_item(item)
 
             # Now upsert the item with the serialized datetime values
             await self._container.upsert_item(body=document)
@@ -309,6 +376,23 @@ class CosmosMemoryContext(MemoryStoreBase):
         """
         return await self.get_steps_by_plan(plan_id)
 
+    async def get_steps_for_plans(self, plan_ids: List[str]) -> List[List[Step]]:
+        """Retrieve the steps of several plans, bounded by the context's query budget.
+
+        Args:
+            plan_ids: The IDs of the plans to retrieve steps for
+
+        Returns:
+            One list of Step objects per plan, in the order of plan_ids
+        """
+        async def get_steps_bounded(plan_id: str) -> List[Step]:
+            async with self._query_semaphore:
+                return await self.get_steps_by_plan(plan_id)
+
+        return await asyncio.gather(
+            *[get_steps_bounded(plan_id) for plan_id in plan_ids]
+        )
+
     async def get_step(self, step_id: str, session_id: str) -> Optional[Step]:
         return await self.get_item_by_id(
             step_id, partition_key=session_id, model_class=Step
@@ -392,13 +476,7 @@ class CosmosMemoryContext(MemoryStoreBase):
             async for item in items:
                 content = item.get("content", {})
                 role = content.get("role", "user")
-                chat_role = AuthorRole.ASSISTANT
-                if role == "user":
-                    chat_role = AuthorRole.USER
-                elif role == "system":
-                    chat_role = AuthorRole.SYSTEM
-                elif role == "tool":  # Equivalent to FunctionExecutionResultMessage
-                    chat_role = AuthorRole.TOOL
+                chat_role = ROLE_MAPPING.get(role, AuthorRole.ASSISTANT)
 
                 message = ChatMessageContent(
                     role=chat_role,
@@ -500,6 +578,15 @@ class CosmosMemoryContext(MemoryStoreBase):
         """Delete all items of a specific type from Cosmos DB."""
         await self.delete_all_messages(data_type)
 
+    async def delete_all_items_of_types(self, data_types: List[str]) -> None:
+        """Delete all items of any of the given types with a single query."""
+        query = "SELECT c.id, c.session_id FROM c WHERE ARRAY_CONTAINS(@data_types, c.data_type) AND c.user_id=@user_id"
+        parameters = [
+            {"name": "@data_types", "value": data_types},
+            {"name": "@user_id", "value": self.user_id},
+        ]
+        await self.delete_items_by_query(query, parameters)
+
     async def get_all_messages(self) -> List[Dict[str, Any]]:
         """Retrieve all messages from Cosmos DB."""
         await self.ensure_initialized()
@@ -563,11 +650,12 @@ class CosmosMemoryContext(MemoryStoreBase):
             parameters = [{"name": "@session_id", "value": self.session_id}]
 
             items = self._container.query_items(query=query, parameters=parameters)
-            collections = []
+            # Keyed by name so duplicates are dropped in O(1) while keeping order
+            collections: Dict[str, None] = {}
             async for item in items:
-                if "collection" in item and item["collection"] not in collections:
-                    collections.append(item["collection"])
-            return collections
+                if "collection" in item:
+                    collections.setdefault(item["collection"], None)
+            return list(collections)
         except Exception as e:
             logging.exception(f"Failed to get collections from Cosmos DB: {e}")
             return []
@@ -600,9 +688,11 @@ class CosmosMemoryContext(MemoryStoreBase):
         except Exception as e:
             logging.exception(f"Failed to delete collection from Cosmos DB: {e}")
 
-    async def upsert_memory_record(self, collection: str, record: MemoryRecord) -> str:
-        """Store a memory record."""
-        memory_dict = {
+    def _memory_record_document(
+        self, collection: str, record: MemoryRecord
+    ) -> Dict[str, Any]:
+        """Build the Cosmos document for a memory record."""
+        return {
             "id": record.id or str(uuid.uuid4()),
             "session_id": self.session_id,
             "user_id": self.user_id,
@@ -618,6 +708,9 @@ class CosmosMemoryContext(MemoryStoreBase):
             "key": record.key,
         }
 
+    async def upsert_memory_record(self, collection: str, record: MemoryRecord) -> str:
+        """Store a memory record."""
+        memory_dict = self._memory_record_document(collection, record)
         await self._container.upsert_item(body=memory_dict)
         return memory_dict["id"]
 
@@ -740,12 +833,59 @@ class CosmosMemoryContext(MemoryStoreBase):
     async def upsert_batch(
         self, collection_name: str, records: List[MemoryRecord]
     ) -> List[str]:
-        """Upsert a batch of memory records into the store."""
-        result_ids = []
-        for record in records:
-            record_id = await self.upsert_memory_record(collection_name, record)
-            result_ids.append(record_id)
-        return result_ids
+        """Upsert a batch of memory records into the store.
+
+        All memory records share the session partition, so records are sent as
+        transactional batches sized to stay within Cosmos DB's operation and
+        payload limits. Each batch is all-or-nothing: if one fails, a
+        CosmosBatchOperationError is raised, that batch is rolled back, and
+        records from earlier batches stay written. Upserts are idempotent, so
+        callers can retry the whole call.
+        """
+        await self.ensure_initialized()
+
+        documents = [
+            self._memory_record_document(collection_name, record) for record in records
+        ]
+        for chunk in self._chunk_for_batch(documents):
+            if len(chunk) == 1:
+                # A lone document, e.g. one too large to share a batch, needs no batch
+                await self._container.upsert_item(body=chunk[0])
+                continue
+            try:
+                await self._container.execute_item_batch(
+                    batch_operations=[("upsert", (document,)) for document in chunk],
+                    partition_key=self.session_id,
+                )
+            except CosmosBatchOperationError as e:
+                logging.error(
+                    "Batch upsert of %d memory records failed at operation %s: %s",
+                    len(chunk),
+                    e.error_index,
+                    e.message,
+                )
+                raise
+        return [document["id"] for document in documents]
+
+    @staticmethod
+    def _chunk_for_batch(documents: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split documents into chunks within the batch operation and byte limits."""
+        chunks: List[List[Dict[str, Any]]] = []
+        chunk: List[Dict[str, Any]] = []
+        chunk_bytes = 0
+        for document in documents:
+            document_bytes = len(json.dumps(document))
+            if chunk and (
+                len(chunk) >= COSMOS_BATCH_LIMIT
+                or chunk_bytes + document_bytes > COSMOS_BATCH_MAX_BYTES
+            ):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append(document)
+            chunk_bytes += document_bytes
+        if chunk:
+            chunks.append(chunk)
+        return chunks
 
     async def get(
         self, collection_name: str, key: str, with_embedding: bool = False
@@ -757,12 +897,14 @@ class CosmosMemoryContext(MemoryStoreBase):
         self, collection_name: str, keys: List[str], with_embeddings: bool = False
     ) -> List[MemoryRecord]:
         """Get a batch of memory records from the store."""
-        results = []
-        for key in keys:
-            record = await self.get_memory_record(collection_name, key, with_embeddings)
-            if record:
-                results.append(record)
-        return results
+        async def get_bounded(key: str) -> Optional[MemoryRecord]:
+            async with self._query_semaphore:
+                return await self.get_memory_record(
+                    collection_name, key, with_embeddings
+                )
+
+        records = await asyncio.gather(*[get_bounded(key) for key in keys])
+        return [record for record in records if record]
 
     async def remove(self, collection_name: str, key: str) -> None:
         """Remove a memory record from the store."""
@@ -770,8 +912,11 @@ class CosmosMemoryContext(MemoryStoreBase):
 
     async def remove_batch(self, collection_name: str, keys: List[str]) -> None:
         """Remove a batch of memory records from the store."""
-        for key in keys:
-            await self.remove_memory_record(collection_name, key)
+        async def remove_bounded(key: str) -> None:
+            async with self._query_semaphore:
+                await self.remove_memory_record(collection_name, key)
+
+        await asyncio.gather(*[remove_bounded(key) for key in keys])
 
     async def get_nearest_match(
         self,
@@ -803,17 +948,22 @@ class CosmosMemoryContext(MemoryStoreBase):
                 collection_name, limit=100, with_embeddings=True
             )
 
+            candidates = [record for record in records if record.embedding is not None]
+            if not candidates:
+                return []
+
+            # Score all candidates with one matrix-vector product
+            matrix = np.vstack([record.embedding for record in candidates])
+            similarities = (matrix @ embedding) / (
+                np.linalg.norm(matrix, axis=1) * np.linalg.norm(embedding)
+            )
+
             results = []
-            for record in records:
-                if record.embedding is not None:
-                    similarity = np.dot(embedding, record.embedding) / (
-                        np.linalg.norm(embedding) * np.linalg.norm(record.embedding)
-                    )
-
-                    if similarity >= min_relevance_score:
-                        if not with_embeddings:
-                            record.embedding = None
-                        results.append((record, float(similarity)))
+            for record, similarity in zip(candidates, similarities):
+                if similarity >= min_relevance_score:
+                    if not with_embeddings:
+                        record.embedding = None
+                    results.append((record, float(similarity)))
 
             results.sort(key=lambda x: x[1], reverse=True)
             return results[:limit]
@@ -1,6 +1,8 @@
 import logging
+import time
+import weakref
 from abc import abstractmethod
-from typing import (Any, List, Mapping, Optional)
+from typing import (Any, Dict, List, Mapping, Optional, Tuple)
 
 # Import the new AppConfig instance
 from app_config import config
@@ -14,6 +16,35 @@ from semantic_kernel.functions import KernelFunction
 # Default formatting instructions used across agents
 DEFAULT_FORMATTING_INSTRUCTIONS = "Instructions: returning the output of this function call verbatim to the user in markdown. Then write AGENT SUMMARY: and then include a summary of what you did."
 
+# Per project client: agent name -> (agent id, lookup time). Avoids paging
+# list_agents on every creation; keyed by client so ids found through one
+# project are never served to another
+AGENT_ID_CACHE_TTL_SECONDS = 300
+_agent_id_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[str, float]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_cached_agent_id(client, agent_name: str) -> Optional[str]:
+    """Return the cached id of agent_name for this client, or None if missing or expired."""
+    cached = _agent_id_cache.get(client, {}).get(agent_name)
+    if cached is None:
+        return None
+    agent_id, cached_at = cached
+    if time.monotonic() - cached_at >= AGENT_ID_CACHE_TTL_SECONDS:
+        return None
+    return agent_id
+
+
+def _cache_agent_id(client, agent_name: str, agent_id: str) -> None:
+    """Remember the id of agent_name for this client."""
+    _agent_id_cache.setdefault(client, {})[agent_name] = (agent_id, time.monotonic())
+
+
+def _evict_agent_id(client, agent_name: str) -> None:
+    """Forget the cached id of agent_name for this client."""
+    _agent_id_cache.get(client, {}).pop(agent_name, None)
+
 
 class BaseAgent(AzureAIAgent):
     """BaseAgent implemented using Semantic Kernel with Azure AI Agent support."""
@@ -143,8 +174,8 @@ class BaseAgent(AzureAIAgent):
                 if chunk is not None:
                     response_content += str(chunk)
 
-            logging.info(f"Response content length: {len(response_content)}")
-            logging.info(f"Response content: {response_content}")
+            logging.debug("Response content length: %d", len(response_content))
+            logging.debug("Response content: %s", response_content)
 
             # Store agent message in cosmos memory
             await self._memory_store.add_item(
@@ -275,21 +306,25 @@ class BaseAgent(AzureAIAgent):
 
             # # First try to get an existing agent with this name as assistant_id
             try:
-                agent_id = None
-                agent_list = client.agents.list_agents()
-                async for agent in agent_list:
-                    if agent.name == agent_name:
-                        agent_id = agent.id
-                        break
+                agent_id = _get_cached_agent_id(client, agent_name)
+                if agent_id is None:
+                    agent_list = client.agents.list_agents()
+                    async for agent in agent_list:
+                        if agent.name == agent_name:
+                            agent_id = agent.id
+                            _cache_agent_id(client, agent_name, agent_id)
+                            break
                 # If the agent already exists, we can use it directly
                 # Get the existing agent definition
                 if agent_id is not None:
-                    logging.info(f"Agent with ID {agent_id} exists.")
+                    logging.debug("Agent with ID %s exists.", agent_id)
 
                     existing_definition = await client.agents.get_agent(agent_id)
 
                     return existing_definition
             except Exception as e:
+                # Drop any cached id so a stale entry is not reused
+                _evict_agent_id(client, agent_name)
                 # The Azure AI Projects SDK throws an exception when the agent doesn't exist
                 # (not returning None), so we catch it and proceed to create a new agent
                 if "ResourceNotFound" in str(e) or "404" in str(e):
@@ -310,6 +345,7 @@ class BaseAgent(AzureAIAgent):
                 temperature=temperature,
                 response_format=response_format,
             )
+            _cache_agent_id(client, agent_name, agent_definition.id)
 
             return agent_definition
         except Exception as exc:
@@ -121,8 +121,10 @@ class AgentFactory:
             session_id in cls._agent_cache
             and agent_type in cls._agent_cache[session_id]
         ):
-            logger.info(
-                f"Returning cached agent instance for session {session_id} and agent type {agent_type}"
+            logger.debug(
+                "Returning cached agent instance for session %s and agent type %s",
+                session_id,
+                agent_type,
             )
             return cls._agent_cache[session_id][agent_type]
 
@@ -247,8 +249,8 @@ class AgentFactory:
         for agent_type, agent in agents.items():
             agent_name = agent_type.value
 
-            logging.info(
-                f"Creating agent instance for {agent_name} with type {agent_type}"
+            logging.debug(
+                "Creating agent instance for %s with type %s", agent_name, agent_type
             )
             agent_instances[agent_name] = agent
 
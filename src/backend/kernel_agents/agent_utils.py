@@ -1,4 +1,5 @@
 import json
+import logging
 from typing import Optional
 
 import semantic_kernel as sk
@@ -77,7 +78,7 @@ async def extract_and_update_transition_states(
             return step
 
         except Exception as e:
-            print(f"Error extracting transition states: {e}")
+            logging.error("Error extracting transition states: %s", e)
             return None
 
 
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import logging
 from typing import Awaitable, Callable, Dict
 
@@ -30,9 +32,6 @@ class HealthCheckSummary:
             ),
         )
 
-    def AddException(self, name: str, exception: Exception):
-        self.Add(name, HealthCheckResult(False, str(exception)))
-
 
 class HealthCheckMiddleware(BaseHTTPMiddleware):
     __healthz_path = "/healthz"
@@ -42,26 +41,40 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
         app,
         checks: Dict[str, Callable[..., Awaitable[HealthCheckResult]]],
         password: str = None,
+        timeout: float = 10.0,
     ):
         super().__init__(app)
         self.checks = checks
         self.password = password
+        # Per-check budget in seconds so one hung dependency cannot stall /healthz
+        self.timeout = timeout
+
+    async def _run_check(
+        self, name: str, check: Callable[..., Awaitable[HealthCheckResult]]
+    ) -> HealthCheckResult:
+        try:
+            if not inspect.iscoroutinefunction(check):
+                logging.error(f"Check {name} is not a coroutine function")
+                raise ValueError(f"Check {name} is not a coroutine function")
+            return await asyncio.wait_for(check(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            logging.error(f"Check {name} timed out after {self.timeout} seconds")
+            return HealthCheckResult(False, f"Timed out after {self.timeout} seconds")
+        except Exception as e:
+            logging.error(f"Check {name} failed: {e}")
+            return HealthCheckResult(False, str(e))
 
     async def check(self) -> HealthCheckSummary:
         results = HealthCheckSummary()
         results.AddDefault()
 
-        for name, check in self.checks.items():
-            if not name or not check:
-                continue
-            try:
-                if not callable(check) or not hasattr(check, "__await__"):
-                    logging.error(f"Check {name} is not a coroutine function")
-                    raise ValueError(f"Check {name} is not a coroutine function")
-                results.Add(name, await check())
-            except Exception as e:
-                logging.error(f"Check {name} failed: {e}")
-                results.AddException(name, e)
+        # Checks are independent, so run them concurrently and report in order
+        checks = [(name, check) for name, check in self.checks.items() if name and check]
+        outcomes = await asyncio.gather(
+            *[self._run_check(name, check) for name, check in checks]
+        )
+        for (name, _), outcome in zip(checks, outcomes):
+            results.Add(name, outcome)
 
         return results
 
@@ -2,53 +2,57 @@
 Quick test for the fixed utils_date.py functionality
 """
 
-import os
-from datetime import datetime
-from utils_date import format_date_for_user
-
-
-def test_date_formatting():
-    """Test the date formatting function with various inputs"""
-
-    # Set up different language environments
-    test_cases = [
-        ('en-US', '2025-07-29', 'US English'),
-        ('en-IN', '2025-07-29', 'Indian English'),
-        ('en-GB', '2025-07-29', 'British English'),
-        ('fr-FR', '2025-07-29', 'French'),
-        ('de-DE', '2025-07-29', 'German'),
-    ]
-
-    print("Testing date formatting with different locales:")
-    print("=" * 50)
+import locale
 
-    for locale, date_str, description in test_cases:
-        os.environ['USER_LOCAL_BROWSER_LANGUAGE'] = locale
-        try:
-            result = format_date_for_user(date_str)
-            print(f"{description} ({locale}): {result}")
-        except Exception as e:
-            print(f"{description} ({locale}): ERROR - {e}")
+import pytest
 
-    print("\n" + "=" * 50)
-    print("Testing with datetime object:")
-
-    # Test with datetime object
-    os.environ['USER_LOCAL_BROWSER_LANGUAGE'] = 'en-US'
-    dt = datetime(2025, 7, 29, 14, 30, 0)
-    result = format_date_for_user(dt)
-    print(f"Datetime object: {result}")
+from utils_date import format_date_for_user
 
-    print("\nTesting error handling:")
-    print("=" * 30)
 
-    # Test error handling
+def locale_available(name):
+    """Return True if the process can switch LC_TIME to the given locale."""
+    saved = locale.setlocale(locale.LC_TIME)
     try:
-        result = format_date_for_user('invalid-date-string')
-        print(f"Invalid date: {result}")
-    except Exception as e:
-        print(f"Invalid date: ERROR - {e}")
-
-
-if __name__ == "__main__":
-    test_date_formatting()
+        locale.setlocale(locale.LC_TIME, name)
+        return True
+    except locale.Error:
+        return False
+    finally:
+        locale.setlocale(locale.LC_TIME, saved)
+
+
+@pytest.fixture(autouse=True)
+def restore_time_locale():
+    """format_date_for_user changes the process locale; put it back after each test."""
+    saved = locale.setlocale(locale.LC_TIME)
+    yield
+    locale.setlocale(locale.LC_TIME, saved)
+
+
+@pytest.mark.parametrize(
+    "user_locale, expected",
+    [
+        ("C", "July 29, 2025"),
+        ("POSIX", "July 29, 2025"),
+        ("en_US.UTF-8", "July 29, 2025"),
+        ("en_GB.UTF-8", "July 29, 2025"),
+        ("fr_FR.UTF-8", "juillet 29, 2025"),
+        ("de_DE.UTF-8", "Juli 29, 2025"),
+    ],
+)
+def test_date_formatting(user_locale, expected):
+    """Test the date formatting function with each user locale"""
+    if not locale_available(user_locale):
+        pytest.skip(f"Locale {user_locale} is not installed")
+
+    assert format_date_for_user("2025-07-29", user_locale) == expected
+
+
+def test_date_formatting_unknown_locale():
+    """Test that an unknown locale falls back to the raw date"""
+    assert format_date_for_user("2025-07-29", "xx_XX.UTF-8") == "2025-07-29"
+
+
+def test_date_formatting_invalid_date():
+    """Test the date formatting function error handling"""
+    assert format_date_for_user("invalid-date-string", "C") == "invalid-date-string"
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.backend.tests.isolation import isolated_backend_import
+
+with isolated_backend_import():
+    from src.backend.kernel_agents import agent_base
+    from src.backend.kernel_agents.agent_base import BaseAgent
+
+
+async def async_iterable(items):
+    """Helper to create an async iterable."""
+    for item in items:
+        yield item
+
+
+def make_client(existing_agents):
+    """Create a mock project client whose list_agents yields existing_agents."""
+    client = MagicMock()
+    client.agents.list_agents = MagicMock(
+        side_effect=lambda: async_iterable(existing_agents)
+    )
+    client.agents.get_agent = AsyncMock(
+        side_effect=lambda agent_id: SimpleNamespace(id=agent_id)
+    )
+    client.agents.create_agent = AsyncMock(
+        return_value=SimpleNamespace(id="created-id")
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_id_cache():
+    """Isolate the module-level agent id cache between tests."""
+    agent_base._agent_id_cache.clear()
+    yield
+    agent_base._agent_id_cache.clear()
+
+
+async def test_cached_agent_id_skips_list_agents():
+    """Test that a second lookup for the same agent is served from the cache."""
+    client = make_client([SimpleNamespace(name="HrAgent", id="hr-id")])
+
+    first = await BaseAgent._create_azure_ai_agent_definition("HrAgent", "", client=client)
+    second = await BaseAgent._create_azure_ai_agent_definition("HrAgent", "", client=client)
+
+    assert first.id == second.id == "hr-id"
+    assert client.agents.list_agents.call_count == 1
+    client.agents.create_agent.assert_not_called()
+
+
+async def test_cached_agent_id_expires(monkeypatch):
+    """Test that an expired entry is looked up again."""
+    client = make_client([SimpleNamespace(name="HrAgent", id="hr-id")])
+
+    await BaseAgent._create_azure_ai_agent_definition("HrAgent", "", client=client)
+    monkeypatch.setattr(agent_base, "AGENT_ID_CACHE_TTL_SECONDS", 0)
+    await BaseAgent._create_azure_ai_agent_definition("HrAgent", "", client=client)
+
+    assert client.agents.list_agents.call_count == 2
+
+
+async def test_cached_agent_id_evicted_when_get_agent_fails():
+    """Test that a stale id is dropped and the agent is recreated."""
+    client = make_client([SimpleNamespace(name="HrAgent", id="hr-id")])
+    await BaseAgent._create_azure_ai_agent_definition("HrAgent", "", client=client)
+
+    client.agents.get_agent.side_effect = Exception("ResourceNotFound")
+    definition = await BaseAgent._create_azure_ai_agent_definition(
+        "HrAgent", "", client=client
+    )
+
+    assert definition.id == "created-id"
+    assert agent_base._get_cached_agent_id(client, "HrAgent") == "created-id"
+
+
+async def test_cached_agent_id_scoped_per_client():
+    """Test that an id found through one project client is not served to another."""
+    first_client = make_client([SimpleNamespace(name="HrAgent", id="hr-id")])
+    other_client = make_client([])
+
+    await BaseAgent._create_azure_ai_agent_definition(
+        "HrAgent", "", client=first_client
+    )
+    definition = await BaseAgent._create_azure_ai_agent_definition(
+        "HrAgent", "", client=other_client
+    )
+
+    assert definition.id == "created-id"
+    other_client.agents.list_agents.assert_called_once()
+    other_client.agents.get_agent.assert_not_called()
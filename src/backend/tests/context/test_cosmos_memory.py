@@ -54,7 +54,6 @@ def mock_config(mock_cosmos_client):
         yield
 
 
-@pytest.mark.asyncio
 async def test_initialize(mock_config, mock_cosmos_client):
     """Test if the Cosmos DB container is initialized correctly."""
     mock_client, mock_container, _ = mock_cosmos_client
@@ -0,0 +1,394 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from azure.cosmos.exceptions import CosmosBatchOperationError
+
+from src.backend.tests.isolation import isolated_backend_import
+
+with isolated_backend_import():
+    from src.backend.context.cosmos_memory_kernel import (
+        COSMOS_BATCH_LIMIT,
+        COSMOS_BATCH_MAX_BYTES,
+        COSMOS_MAX_CONCURRENCY,
+        CosmosMemoryContext,
+    )
+
+
+async def async_iterable(items):
+    """Helper to create an async iterable."""
+    for item in items:
+        yield item
+
+
+def make_context(database):
+    """Create a memory context wired to a mocked Cosmos database client."""
+    context = CosmosMemoryContext(
+        session_id="test_session",
+        user_id="test_user",
+        cosmos_container="mock-container",
+        cosmos_endpoint="https://mock-endpoint",
+        cosmos_database="mock-database",
+    )
+    context._database = database
+    return context
+
+
+@pytest.fixture(autouse=True)
+def clear_container_cache():
+    """Isolate the class-level container cache between tests."""
+    CosmosMemoryContext.clear_container_cache()
+    yield
+    CosmosMemoryContext.clear_container_cache()
+
+
+@pytest.fixture
+def mock_database():
+    """Fixture for a mocked Cosmos database client."""
+    database = MagicMock()
+    database.create_container_if_not_exists = AsyncMock(return_value=AsyncMock())
+    return database
+
+
+async def test_initialize_reuses_cached_container(mock_database):
+    """Test that later contexts reuse the container without recreating it."""
+    await make_context(mock_database).initialize()
+    context = make_context(mock_database)
+    await context.initialize()
+
+    mock_database.create_container_if_not_exists.assert_called_once()
+    assert context._container is mock_database.create_container_if_not_exists.return_value
+
+
+async def test_clear_container_cache_forces_setup(mock_database):
+    """Test that clearing the cache makes the next context set up the container again."""
+    await make_context(mock_database).initialize()
+    CosmosMemoryContext.clear_container_cache()
+    await make_context(mock_database).initialize()
+
+    assert mock_database.create_container_if_not_exists.call_count == 2
+
+
+async def test_concurrent_initialize_shares_one_setup(mock_database):
+    """Test that concurrent first initializations make a single container setup call."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_create(**kwargs):
+        started.set()
+        await release.wait()
+        return "container"
+
+    mock_database.create_container_if_not_exists = AsyncMock(side_effect=slow_create)
+    contexts = [make_context(mock_database) for _ in range(5)]
+
+    tasks = [asyncio.create_task(context.initialize()) for context in contexts]
+    await started.wait()
+    release.set()
+    await asyncio.gather(*tasks)
+
+    mock_database.create_container_if_not_exists.assert_called_once()
+    assert all(context._container == "container" for context in contexts)
+    assert CosmosMemoryContext._container_inflight == {}
+
+
+async def test_failed_setup_is_retried(mock_database):
+    """Test that a failed setup is dropped from the in-flight map and retried."""
+    mock_database.create_container_if_not_exists = AsyncMock(
+        side_effect=[Exception("boom"), "container"]
+    )
+
+    failed = make_context(mock_database)
+    await failed.initialize()
+    assert failed._container is None
+    assert CosmosMemoryContext._container_inflight == {}
+
+    retried = make_context(mock_database)
+    await retried.initialize()
+    assert retried._container == "container"
+    assert mock_database.create_container_if_not_exists.call_count == 2
+
+
+async def test_failed_setup_logged_when_all_waiters_cancelled(mock_database, caplog):
+    """Test that a setup failure is still retrieved after every waiter was cancelled."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def failing_create(**kwargs):
+        started.set()
+        await release.wait()
+        raise Exception("boom")
+
+    mock_database.create_container_if_not_exists = AsyncMock(side_effect=failing_create)
+
+    waiter = asyncio.create_task(make_context(mock_database).initialize())
+    await started.wait()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    while CosmosMemoryContext._container_inflight:
+        await asyncio.sleep(0)
+
+    assert "container setup for mock-container failed: boom" in caplog.text
+
+
+def make_records(count, dimensions):
+    """Create memory records carrying embeddings of the given size."""
+    return [
+        SimpleNamespace(
+            id=f"record-{i}",
+            text="text",
+            description="description",
+            external_source_name=None,
+            additional_metadata=None,
+            embedding=np.random.default_rng(i).random(dimensions),
+            key=f"key-{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def batch_documents(container):
+    """Return the documents sent in each execute_item_batch call."""
+    return [
+        [operation[1][0] for operation in call.kwargs["batch_operations"]]
+        for call in container.execute_item_batch.call_args_list
+    ]
+
+
+async def test_upsert_batch_chunks_by_operation_count(mock_database):
+    """Test that small records are sent in chunks of at most COSMOS_BATCH_LIMIT."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    records = make_records(250, 2)
+
+    ids = await context.upsert_batch("collection", records)
+
+    batches = batch_documents(context._container)
+    assert [len(batch) for batch in batches] == [COSMOS_BATCH_LIMIT, COSMOS_BATCH_LIMIT, 50]
+    assert all(
+        call.kwargs["partition_key"] == "test_session"
+        for call in context._container.execute_item_batch.call_args_list
+    )
+    assert ids == [record.id for record in records]
+    assert [document["id"] for batch in batches for document in batch] == ids
+
+
+async def test_upsert_batch_chunks_by_payload_size(mock_database):
+    """Test that large embeddings split chunks to stay under the byte budget."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    records = make_records(COSMOS_BATCH_LIMIT, 1536)
+
+    ids = await context.upsert_batch("collection", records)
+
+    batches = batch_documents(context._container)
+    assert len(batches) > 1
+    assert all(len(json.dumps(batch)) <= COSMOS_BATCH_MAX_BYTES for batch in batches)
+    assert [document["id"] for batch in batches for document in batch] == ids
+    assert ids == [record.id for record in records]
+
+
+async def test_upsert_batch_failure_keeps_earlier_batches(mock_database):
+    """Test that a failing batch raises after earlier batches were already written."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    context._container.execute_item_batch.side_effect = [
+        None,
+        CosmosBatchOperationError(
+            error_index=3,
+            headers={},
+            status_code=409,
+            message="Conflict",
+            operation_responses=[],
+        ),
+    ]
+    records = make_records(COSMOS_BATCH_LIMIT + 50, 2)
+
+    with pytest.raises(CosmosBatchOperationError):
+        await context.upsert_batch("collection", records)
+
+    batches = batch_documents(context._container)
+    assert len(batches) == 2
+    assert [document["id"] for document in batches[0]] == [
+        record.id for record in records[:COSMOS_BATCH_LIMIT]
+    ]
+
+
+async def test_upsert_batch_sends_single_document_without_batch(mock_database):
+    """Test that a chunk holding one document falls back to a plain upsert."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+
+    ids = await context.upsert_batch("collection", make_records(1, 2))
+
+    context._container.execute_item_batch.assert_not_called()
+    context._container.upsert_item.assert_awaited_once()
+    assert ids == ["record-0"]
+
+
+def make_tracking_call(result=None):
+    """Create a coroutine function that records its peak concurrency."""
+    state = {"active": 0, "peak": 0}
+
+    async def call(*args, **kwargs):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return result
+
+    return call, state
+
+
+async def test_get_batch_bounds_concurrency(mock_database):
+    """Test that get_batch never runs more than COSMOS_MAX_CONCURRENCY reads at once."""
+    context = make_context(mock_database)
+    call, state = make_tracking_call(result="record")
+    context.get_memory_record = call
+
+    records = await context.get_batch("collection", [f"key-{i}" for i in range(30)])
+
+    assert len(records) == 30
+    assert state["peak"] == COSMOS_MAX_CONCURRENCY
+
+
+async def test_remove_batch_bounds_concurrency(mock_database):
+    """Test that remove_batch never runs more than COSMOS_MAX_CONCURRENCY deletes at once."""
+    context = make_context(mock_database)
+    call, state = make_tracking_call()
+    context.remove_memory_record = call
+
+    await context.remove_batch("collection", [f"key-{i}" for i in range(30)])
+
+    assert state["peak"] == COSMOS_MAX_CONCURRENCY
+
+
+async def test_overlapping_batches_share_concurrency_budget(mock_database):
+    """Test that concurrent get_batch and remove_batch calls share one limit."""
+    context = make_context(mock_database)
+    call, state = make_tracking_call(result="record")
+    context.get_memory_record = call
+    context.remove_memory_record = call
+    keys = [f"key-{i}" for i in range(20)]
+
+    await asyncio.gather(
+        context.get_batch("collection", keys),
+        context.get_batch("collection", keys),
+        context.remove_batch("collection", keys),
+    )
+
+    assert state["peak"] == COSMOS_MAX_CONCURRENCY
+
+
+async def test_get_steps_for_plans_bounded_and_ordered(mock_database):
+    """Test that plan step fetches share the query budget and keep plan order."""
+    context = make_context(mock_database)
+    call, state = make_tracking_call()
+
+    async def get_steps_by_plan(plan_id):
+        await call()
+        return [plan_id]
+
+    context.get_steps_by_plan = get_steps_by_plan
+    plan_ids = [f"plan-{i}" for i in range(20)]
+
+    steps = await context.get_steps_for_plans(plan_ids)
+
+    assert steps == [[plan_id] for plan_id in plan_ids]
+    assert state["peak"] == COSMOS_MAX_CONCURRENCY
+
+
+def make_scored_records():
+    """Create records at known angles to the query vector [1, 0]."""
+    embeddings = {
+        "orthogonal": [0.0, 1.0],
+        "exact": [2.0, 0.0],
+        "opposite": [-1.0, 0.0],
+        "missing": None,
+        "diagonal": [1.0, 1.0],
+    }
+    return [
+        SimpleNamespace(
+            id=name, embedding=None if vector is None else np.array(vector)
+        )
+        for name, vector in embeddings.items()
+    ]
+
+
+@pytest.mark.parametrize("with_embeddings", [False, True])
+async def test_get_nearest_matches_filters_and_orders(mock_database, with_embeddings):
+    """Test scoring, the relevance cutoff, ordering and embedding stripping."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    context.get_memory_records = AsyncMock(return_value=make_scored_records())
+
+    matches = await context.get_nearest_matches(
+        "collection",
+        np.array([1.0, 0.0]),
+        limit=10,
+        min_relevance_score=0.5,
+        with_embeddings=with_embeddings,
+    )
+
+    assert [record.id for record, _ in matches] == ["exact", "diagonal"]
+    assert [score for _, score in matches] == pytest.approx([1.0, 2 ** -0.5])
+    assert all(
+        (record.embedding is not None) == with_embeddings for record, _ in matches
+    )
+
+
+async def test_get_nearest_matches_applies_limit(mock_database):
+    """Test that only the top `limit` matches are returned."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    context.get_memory_records = AsyncMock(return_value=make_scored_records())
+
+    matches = await context.get_nearest_matches(
+        "collection", np.array([1.0, 0.0]), limit=2, min_relevance_score=-1.0
+    )
+
+    assert [record.id for record, _ in matches] == ["exact", "diagonal"]
+
+
+async def test_get_nearest_matches_without_embeddings(mock_database):
+    """Test that records lacking embeddings yield no matches rather than an error."""
+    context = make_context(mock_database)
+    context._container = AsyncMock()
+    context.get_memory_records = AsyncMock(
+        return_value=[SimpleNamespace(id="missing", embedding=None)]
+    )
+
+    assert await context.get_nearest_matches("collection", np.array([1.0, 0.0])) == []
+
+
+async def test_delete_all_items_of_types_uses_one_query(mock_database):
+    """Test that all types are deleted through one query, per-row partition keys."""
+    context = make_context(mock_database)
+    rows = [
+        {"id": "plan-1", "session_id": "session-a"},
+        {"id": "step-1", "session_id": "session-b"},
+    ]
+    context._container = MagicMock()
+    context._container.query_items = MagicMock(return_value=async_iterable(rows))
+    context._container.delete_item = AsyncMock()
+
+    await context.delete_all_items_of_types(["plan", "step"])
+
+    context._container.query_items.assert_called_once()
+    query_kwargs = context._container.query_items.call_args.kwargs
+    assert "ARRAY_CONTAINS(@data_types, c.data_type)" in query_kwargs["query"]
+    assert query_kwargs["parameters"] == [
+        {"name": "@data_types", "value": ["plan", "step"]},
+        {"name": "@user_id", "value": "test_user"},
+    ]
+    assert [call.kwargs for call in context._container.delete_item.await_args_list] == [
+        {"item": "plan-1", "partition_key": "session-a"},
+        {"item": "step-1", "partition_key": "session-b"},
+    ]
+
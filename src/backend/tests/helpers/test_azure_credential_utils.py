@@ -1,11 +1,5 @@
-import pytest
-import sys
-import os
 from unittest.mock import patch, MagicMock
 
-# Ensure src/backend is on the Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import helpers.azure_credential_utils as azure_credential_utils
 
 # Synchronous tests
@@ -43,7 +37,6 @@ def test_get_azure_credential_non_dev_env(mock_managed_identity_credential, mock
 
 # Asynchronous tests
 
-@pytest.mark.asyncio
 @patch("helpers.azure_credential_utils.os.getenv")
 @patch("helpers.azure_credential_utils.AioDefaultAzureCredential")
 @patch("helpers.azure_credential_utils.AioManagedIdentityCredential")
@@ -60,7 +53,6 @@ async def test_get_azure_credential_async_dev_env(mock_aio_managed_identity_cred
     mock_aio_managed_identity_credential.assert_not_called()
     assert credential == mock_aio_default_credential
 
-@pytest.mark.asyncio
 @patch("helpers.azure_credential_utils.os.getenv")
 @patch("helpers.azure_credential_utils.AioDefaultAzureCredential")
 @patch("helpers.azure_credential_utils.AioManagedIdentityCredential")
@@ -0,0 +1,37 @@
+"""Helpers for importing backend modules in unit tests without leaking mock config."""
+
+import os
+import sys
+from contextlib import contextmanager
+from unittest.mock import patch
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Settings app_config requires at import time
+MOCK_ENV = {
+    "AZURE_OPENAI_ENDPOINT": "https://mock-openai-endpoint",
+    "AZURE_AI_SUBSCRIPTION_ID": "mock-subscription-id",
+    "AZURE_AI_RESOURCE_GROUP": "mock-resource-group",
+    "AZURE_AI_PROJECT_NAME": "mock-project-name",
+    "AZURE_AI_AGENT_ENDPOINT": "https://mock-agent-endpoint",
+}
+
+
+@contextmanager
+def isolated_backend_import():
+    """Import backend modules under mock settings, then drop their flat-path copies.
+
+    Backend modules import each other by flat name (``app_config``,
+    ``context.cosmos_memory_kernel``) and app_config builds its config once at
+    import. Forgetting the flat modules loaded here means later test modules
+    import them afresh against the real environment.
+    """
+    before = set(sys.modules)
+    try:
+        with patch.dict(os.environ, MOCK_ENV):
+            yield
+    finally:
+        for name in set(sys.modules) - before:
+            module_file = getattr(sys.modules[name], "__file__", None) or ""
+            if not name.startswith("src.") and module_file.startswith(BACKEND_DIR):
+                del sys.modules[name]
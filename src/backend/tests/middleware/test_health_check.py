@@ -4,7 +4,7 @@ from src.backend.middleware.health_check import (
 )
 from fastapi import FastAPI
 from starlette.testclient import TestClient
-from asyncio import sleep
+from asyncio import Event, sleep
 
 
 # Updated helper functions for test health checks
@@ -70,3 +70,65 @@ def test_health_check_incorrect_password():
 
     assert response.status_code == 503  # Because one check is failing
     assert response.text == "Service Unavailable"
+
+
+def test_health_check_all_passing():
+    """Test that async def checks are run and a passing set reports OK."""
+    passing_app = FastAPI()
+    passing_app.add_middleware(
+        HealthCheckMiddleware, checks={"success": successful_check}, password="test123"
+    )
+    client = TestClient(passing_app)
+    response = client.get("/healthz?code=test123")
+
+    assert response.status_code == 200
+    assert response.json()["results"]["success"]["message"] == "Successful check"
+
+
+async def test_health_check_timeout():
+    """Test that a check exceeding the timeout is reported as failed."""
+
+    async def instant_check():
+        return HealthCheckResult(status=True, message="Instant check")
+
+    async def hung_check():
+        await Event().wait()  # Never set, so only the timeout can end it
+        return HealthCheckResult(status=True, message="Too late")
+
+    middleware = HealthCheckMiddleware(
+        FastAPI(),
+        checks={"success": instant_check, "slow": hung_check},
+        timeout=0.2,
+    )
+    summary = await middleware.check()
+
+    assert summary.status is False
+    assert summary.results["success"].status is True
+    assert summary.results["slow"].status is False
+    assert "Timed out" in summary.results["slow"].message
+
+
+async def test_health_checks_run_concurrently():
+    """Test that checks overlap: each one waits for the other to start."""
+    started = {"first": Event(), "second": Event()}
+
+    def make_check(name, other):
+        async def check():
+            started[name].set()
+            await started[other].wait()
+            return HealthCheckResult(status=True, message=f"{name} check")
+
+        return check
+
+    # Run one after another the first check would wait forever and time out
+    middleware = HealthCheckMiddleware(
+        FastAPI(),
+        checks={
+            "first": make_check("first", "second"),
+            "second": make_check("second", "first"),
+        },
+        timeout=5,
+    )
+    summary = await middleware.check()
+
+    assert summary.status is True
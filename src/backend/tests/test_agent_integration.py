@@ -4,15 +4,11 @@ This test file verifies that the agent system correctly loads environment
 variables and can use functions from the JSON tool files.
 """
 import os
-import sys
 import unittest
 import asyncio
 import uuid
 from dotenv import load_dotenv
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config_kernel import Config
 from kernel_agents.agent_factory import AgentFactory
 from models.messages_kernel import AgentType
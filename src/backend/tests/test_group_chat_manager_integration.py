@@ -6,7 +6,6 @@ These are real integration tests using real Cosmos DB connections and Azure Open
 then cleaning up the test data afterward.
 """
 import os
-import sys
 import unittest
 import asyncio
 import uuid
@@ -15,9 +14,6 @@ from typing import Dict, List, Optional, Any, Set
 from dotenv import load_dotenv
 from datetime import datetime
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config_kernel import Config
 from kernel_agents.group_chat_manager import GroupChatManager
 from kernel_agents.planner_agent import PlannerAgent
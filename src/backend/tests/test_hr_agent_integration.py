@@ -1,13 +1,9 @@
-import sys
 import os
 import pytest
 import logging
 import json
 import asyncio
 
-# Ensure src/backend is on the Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from config_kernel import Config
 from kernel_agents.agent_factory import AgentFactory
 from models.messages_kernel import AgentType
@@ -64,7 +60,6 @@ def find_tools_json_file(agent_type_str):
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_azure_project_client_connection():
     """
     Integration test to verify that we can successfully create a connection to Azure using the project client.
@@ -85,7 +80,6 @@ async def test_azure_project_client_connection():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_create_hr_agent():
     """Test that we can create an HR agent."""
     # Reset cached clients
@@ -124,7 +118,6 @@ async def test_create_hr_agent():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio 
 async def test_hr_agent_loads_tools_from_json():
     """Test that the HR agent loads tools from its JSON file."""
     # Reset cached clients
@@ -191,7 +184,6 @@ async def test_hr_agent_loads_tools_from_json():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_hr_agent_has_system_message():
     """Test that the HR agent is created with a domain-appropriate system message."""
     # Reset cached clients
@@ -225,7 +217,6 @@ async def test_hr_agent_has_system_message():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_hr_agent_tools_existence():
     """Test that the HR agent has the expected tools available."""
     # Reset cached clients
@@ -281,7 +272,6 @@ async def test_hr_agent_tools_existence():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_hr_agent_direct_tool_execution():
     """Test that we can directly execute HR agent tools using the agent instance."""
     # Reset cached clients
@@ -352,7 +342,6 @@ async def test_hr_agent_direct_tool_execution():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_hr_agent_function_calling():
     """Test that the HR agent uses function calling when processing a request."""
     # Reset cached clients
@@ -1,12 +1,8 @@
-import sys
 import os
 import pytest
 import logging
 import json
 
-# Ensure src/backend is on the Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from config_kernel import Config
 from kernel_agents.agent_factory import AgentFactory
 from models.messages_kernel import AgentType
@@ -64,7 +60,6 @@ def find_tools_json_file(agent_type_str):
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_azure_project_client_connection():
     """
     Integration test to verify that we can successfully create a connection to Azure using the project client.
@@ -85,7 +80,6 @@ async def test_azure_project_client_connection():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_create_human_agent():
     """Test that we can create a Human agent."""
     # Reset cached clients
@@ -124,7 +118,6 @@ async def test_create_human_agent():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio 
 async def test_human_agent_loads_tools():
     """Test that the Human agent loads tools from its JSON file."""
     # Reset cached clients
@@ -175,7 +168,6 @@ async def test_human_agent_loads_tools():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_human_agent_has_system_message():
     """Test that the Human agent is created with a domain-specific system message."""
     # Reset cached clients
@@ -208,7 +200,6 @@ async def test_human_agent_has_system_message():
 
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_human_agent_has_methods():
     """Test that the Human agent has the expected methods."""
     # Reset cached clients
@@ -1,4 +1,3 @@
-import sys
 import os
 import pytest
 import logging
@@ -8,9 +7,6 @@ import asyncio
 from unittest import mock
 from typing import Any, Dict, List, Optional
 
-# Ensure src/backend is on the Python path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from config_kernel import Config
 from kernel_agents.agent_factory import AgentFactory
 from models.messages_kernel import AgentType
@@ -97,7 +93,6 @@ async def ai_project_client():
     Config._Config__ai_project_client = old_client
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_azure_project_client_connection():
     """
     Integration test to verify that we can successfully create a connection to Azure using the project client.
@@ -127,7 +122,6 @@ async def test_azure_project_client_connection():
         (AgentType.TECH_SUPPORT, TechSupportAgent),
     ]
 )
-@pytest.mark.asyncio
 async def test_create_real_agent(agent_type, expected_agent_class, ai_project_client):
     """
     Parameterized integration test to verify that we can create real agents of different types.
@@ -181,7 +175,6 @@ async def test_create_real_agent(agent_type, expected_agent_class, ai_project_cl
         AgentType.TECH_SUPPORT,
     ]
 )
-@pytest.mark.asyncio
 async def test_agent_loads_tools_from_json(agent_type, ai_project_client):
     """
     Parameterized integration test to verify that each agent loads tools from its
@@ -249,7 +242,6 @@ async def test_agent_loads_tools_from_json(agent_type, ai_project_client):
         AgentType.TECH_SUPPORT,
     ]
 )
-@pytest.mark.asyncio
 async def test_agent_has_system_message(agent_type, ai_project_client):
     """
     Parameterized integration test to verify that each agent is created with a domain-specific system message.
@@ -294,7 +286,6 @@ async def test_agent_has_system_message(agent_type, ai_project_client):
     return True
 
 @skip_if_no_azure
-@pytest.mark.asyncio
 async def test_human_agent_can_execute_method(ai_project_client):
     """
     Test that the Human agent can execute the handle_action_request method.
@@ -1,11 +1,6 @@
-import sys
-import os
 from unittest.mock import patch, MagicMock
 from src.backend.otlp_tracing import configure_oltp_tracing  # Import directly since it's in backend
 
-# Add the backend directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 
 @patch("src.backend.otlp_tracing.TracerProvider")
 @patch("src.backend.otlp_tracing.OTLPSpanExporter")
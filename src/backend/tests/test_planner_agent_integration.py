@@ -5,7 +5,6 @@ and properly integrates with Cosmos DB memory context. These are real integratio
 using real Cosmos DB connections and then cleaning up the test data afterward.
 """
 import os
-import sys
 import unittest
 import asyncio
 import uuid
@@ -14,9 +13,6 @@ from typing import Dict, List, Optional, Any, Set
 from dotenv import load_dotenv
 from datetime import datetime
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config_kernel import Config
 from kernel_agents.planner_agent import PlannerAgent
 from context.cosmos_memory_kernel import CosmosMemoryContext
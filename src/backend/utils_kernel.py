@@ -35,6 +35,13 @@ logging.basicConfig(level=logging.INFO)
 agent_instances: Dict[str, Dict[str, Any]] = {}
 azure_agent_instances: Dict[str, Dict[str, AzureAIAgent]] = {}
 
+# Shared HTTP session so RAI checks reuse pooled keep-alive connections
+rai_session = requests.Session()
+
+# (connect, read) timeouts in seconds: fail fast on an unreachable endpoint
+# while still giving the model time to answer
+RAI_TIMEOUT = (5, 30)
+
 
 async def initialize_runtime_and_context(
     session_id: Optional[str] = None, user_id: str = None
@@ -216,7 +223,7 @@ async def rai_success(description: str, is_task_creation: bool) -> bool:
         }
 
         # Send request
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = rai_session.post(url, headers=headers, json=payload, timeout=RAI_TIMEOUT)
         if response.status_code == 400 or response.status_code == 200:
             response_json = response.json()
 